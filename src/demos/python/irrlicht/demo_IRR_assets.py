@@ -14,6 +14,7 @@
 import pychrono.core as chrono
 import pychrono.irrlicht as chronoirr
 import math as m
+import numpy as np
 
 
 print (" Demo of using the assets sys to create shapes for Irrlicht visualization")
@@ -45,7 +46,7 @@ floor_mat = chrono.ChMaterialSurfaceNSC()
 
 # Define a collision shape
 floor_ct_shape = chrono.ChCollisionShapeBox(floor_mat, 20, 1, 20)
-floor.AddCollisionShape(floor_ct_shape, chrono.ChFrameD(chrono.ChVectorD(0, -1, 0), chrono.QUNIT))
+floor.AddCollisionShape(floor_ct_shape, chrono.ChFrameD(chrono.ChVectorD(0, -1, 0)))
 floor.SetCollide(True)
 
 # Add body to sys
@@ -56,7 +57,7 @@ sys.Add(floor)
 # Note that assets are managed via shared pointer, so they can also be shared.
 boxfloor = chrono.ChVisualShapeBox(20, 1, 20)
 boxfloor.SetColor(chrono.ChColor(0.2, 0.3, 1.0))
-floor.AddVisualShape(boxfloor, chrono.ChFrameD(chrono.ChVectorD(0, -1, 0), chrono.QUNIT))
+floor.AddVisualShape(boxfloor, chrono.ChFrameD(chrono.ChVectorD(0, -1, 0)))
 
 
 # ==Asset== attack a 'path shape populated with segments and arc fillets:
@@ -122,6 +123,7 @@ floor.AddVisualShape(nurbsasset)
 # Create the rigid body as usual (this won't move, it is only for visualization tests)
 body = chrono.ChBody()
 body.SetBodyFixed(True)
+body.SetCollide(False)
 sys.Add(body)
 
 # Create a shared visual material
@@ -131,12 +133,12 @@ orange_mat.SetDiffuseColor(chrono.ChColor(0.9, 0.4, 0.2))
 # ==Asset== Attach a 'sphere' shape
 sphere = chrono.ChVisualShapeSphere(0.5)
 sphere.AddMaterial(orange_mat)
-body.AddVisualShape(sphere, chrono.ChFrameD(chrono.ChVectorD(-1,0,0), chrono.QUNIT))
+body.AddVisualShape(sphere, chrono.ChFrameD(chrono.ChVectorD(-1,0,0)))
 
 # ==Asset== Attach also a 'box' shape
 box = chrono.ChVisualShapeBox(0.6, 1.0, 0.2)
 box.AddMaterial(orange_mat)
-body.AddVisualShape(box, chrono.ChFrameD(chrono.ChVectorD(1,1,0), chrono.QUNIT))
+body.AddVisualShape(box, chrono.ChFrameD(chrono.ChVectorD(1,1,0)))
 
 # ==Asset== Attach also a 'cylinder' shape
 cyl = chrono.ChVisualShapeCylinder(0.3, 0.7)
@@ -150,24 +152,25 @@ mesh = chrono.ChVisualShapeTriangleMesh()
 mesh.GetMesh().addTriangle(chrono.ChVectorD(0, 0, 0), chrono.ChVectorD(0, 1, 0), chrono.ChVectorD(1, 0, 0))
 mesh.AddMaterial(orange_mat)
 
-body.AddVisualShape(mesh, chrono.ChFrameD(chrono.ChVectorD(2,0,2), chrono.QUNIT))
-body.AddVisualShape(mesh, chrono.ChFrameD(chrono.ChVectorD(3,0,2), chrono.QUNIT))
-body.AddVisualShape(mesh, chrono.ChFrameD(chrono.ChVectorD(2,1,2), chrono.QUNIT))
+body.AddVisualShape(mesh, chrono.ChFrameD(chrono.ChVectorD(2,0,2)))
+body.AddVisualShape(mesh, chrono.ChFrameD(chrono.ChVectorD(3,0,2)))
+body.AddVisualShape(mesh, chrono.ChFrameD(chrono.ChVectorD(2,1,2)))
 
 
 # ==Asset== Attach a 'Wavefront mesh' asset, referencing a .obj file and offset it.
 objmesh = chrono.ChVisualShapeModelFile()
 objmesh.SetFilename(chrono.GetChronoDataFile('models/forklift/body.obj'))
 objmesh.SetTexture(chrono.GetChronoDataFile('textures/bluewhite.png'))
-body.AddVisualShape(objmesh, chrono.ChFrameD(chrono.ChVectorD(0,0,2), chrono.QUNIT))
+body.AddVisualShape(objmesh, chrono.ChFrameD(chrono.ChVectorD(0,0,2)))
 
 # ==Asset== , chrono.ChFrameD(chrono.ChVectorD(2,1,2), chrono.QUNIT))
 for j in range(20):
     smallbox = chrono.ChVisualShapeBox(0.2, 0.2, 0.02)
     smallbox.SetColor(chrono.ChColor(j * 0.05, 1 - j * 0.05, 0.0))
-    rot = chrono.ChMatrix33D(chrono.Q_from_AngY(j * 21 * chrono.CH_C_DEG_TO_RAD))
-    pos = rot * chrono.ChVectorD(0.4, 0, 0) + chrono.ChVectorD(0, j * 0.02, 0)
-    body.AddVisualShape(smallbox, chrono.ChFrameD(pos, rot))
+    angle = j * 21 * chrono.CH_C_DEG_TO_RAD
+    # (0.4, 0, 0) rotated about Y, then raised by j * 0.02
+    pos = chrono.ChVectorD(0.4 * m.cos(angle), j * 0.02, -0.4 * m.sin(angle))
+    body.AddVisualShape(smallbox, chrono.ChFrameD(pos, chrono.Q_from_AngY(angle)))
 
 #
 # EXAMPLE 3:
@@ -190,8 +193,11 @@ particles.AddCollisionShape(particles_ct_shape)
 particles.SetCollide(True)
 
 # Create the random particles
-for i in range(100):
-    particles.AddParticle(chrono.ChCoordsysD(chrono.ChVectorD(chrono.ChRandom() - 2, 1.5, chrono.ChRandom() + 2)))
+# (generate all random x and z coordinates at once, with a fixed seed so
+# that the demo is reproducible)
+rng = np.random.default_rng(1234)
+for x, z in rng.random((100, 2)) + [-2, 2]:
+    particles.AddParticle(chrono.ChCoordsysD(chrono.ChVectorD(x, 1.5, z)))
 
 # Mass and inertia properties.
 # This will be shared among all particles in the ChParticleCloud.
@@ -206,14 +212,14 @@ sys.Add(particles)
 sphereparticle = chrono.ChVisualShapeSphere(0.05)
 particles.AddVisualShape(sphereparticle)
  
-displ = chrono.ChVectorD(1.0, 0.0, 0.0)
-v1 = chrono.ChVectorD(0.8, 0.0, 0.0) + displ
-v2 = chrono.ChVectorD(0.8, 0.3, 0.0) + displ
-v3 = chrono.ChVectorD(0.8, 0.3, 0.3) + displ
-v4 = chrono.ChVectorD(0.0, 0.3, 0.3) + displ
-v5 = chrono.ChVectorD(0.0, 0.0, 0.3) + displ
-v6 = chrono.ChVectorD(0.8, 0.0, 0.3) + displ
-mpoints = chrono.vector_ChVectorD([v1 , v2, v3, v4, v5, v6])
+displ = np.array([1.0, 0.0, 0.0])
+hullpoints = np.array([[0.8, 0.0, 0.0],
+                       [0.8, 0.3, 0.0],
+                       [0.8, 0.3, 0.3],
+                       [0.0, 0.3, 0.3],
+                       [0.0, 0.0, 0.3],
+                       [0.8, 0.0, 0.3]]) + displ
+mpoints = chrono.vector_ChVectorD([chrono.ChVectorD(*p) for p in hullpoints])
 
 hull = chrono.ChBodyEasyConvexHullAuxRef(mpoints, 1000, True, True, chrono.ChMaterialSurfaceNSC())
  
@@ -231,11 +237,16 @@ vis.AddSkyBox()
 vis.AddCamera(chrono.ChVectorD(-2, 3, -4))
 vis.AddTypicalLights()
 
+# Add a GUI text element; it is owned by the GUI environment and drawn every frame
+vis.GetGUIEnvironment().addStaticText('Hello World!', chronoirr.recti(50, 60, 150, 80))
+
 # Simulation loop
+step_size = 0.01
+realtime_timer = chrono.ChRealtimeStepTimer()
 while vis.Run():
     vis.BeginScene()
     vis.Render()
-    vis.GetGUIEnvironment().addStaticText('Hello World!', chronoirr.recti(50, 60, 150, 80))
     vis.EndScene()
-    sys.DoStepDynamics(0.01)
+    sys.DoStepDynamics(step_size)
+    realtime_timer.Spin(step_size)
 